@@ -3,49 +3,99 @@
 It is a non-opinionated implementation adding language constructs and convenience methods for working with the API.
 """
 
-from importlib_metadata import PackageNotFoundError, version
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+from libcnb._version import __version__  # noqa: F401
 
 __author__ = "Sambhav Kothari"
 __email__ = "sambhavs.email@gmail.com"
 
-# Used to automatically set version number from github actions
-# as well as not break when being tested locally
-try:
-    __version__ = version(__package__)
-except PackageNotFoundError:  # pragma: no cover
-    __version__ = "0.0.0"
+if TYPE_CHECKING:  # pragma: no cover
+    from libcnb._build import BuildContext, Builder, BuildResult, build
+    from libcnb._buildpack import (
+        Buildpack,
+        BuildpackGroupEntry,
+        BuildpackInfo,
+        BuildpackOrder,
+        BuildpackStack,
+        License,
+    )
+    from libcnb._detect import DetectContext, Detector, DetectResult, detect
+    from libcnb._layers import Environment, ExecD, Layer, Layers, Profile
+    from libcnb._output import (
+        BOMEntry,
+        BuildMetadata,
+        Label,
+        LaunchMetadata,
+        Process,
+        Slice,
+        Store,
+        UnmetPlanEntry,
+    )
+    from libcnb._plan import (
+        BuildpackPlan,
+        BuildpackPlanEntry,
+        BuildPlan,
+        BuildPlanProvide,
+        BuildPlanRequire,
+    )
+    from libcnb._platform import Platform
+    from libcnb._run import run
+
+# The public API is imported lazily (PEP 562) so that an entry point only pays for the
+# submodules, and their third party dependencies, that it actually uses.
+_LAZY_IMPORTS = {
+    "BOMEntry": "libcnb._output",
+    "build": "libcnb._build",
+    "BuildContext": "libcnb._build",
+    "Builder": "libcnb._build",
+    "BuildMetadata": "libcnb._output",
+    "Buildpack": "libcnb._buildpack",
+    "BuildpackGroupEntry": "libcnb._buildpack",
+    "BuildpackInfo": "libcnb._buildpack",
+    "BuildpackOrder": "libcnb._buildpack",
+    "BuildpackPlan": "libcnb._plan",
+    "BuildpackPlanEntry": "libcnb._plan",
+    "BuildpackStack": "libcnb._buildpack",
+    "BuildPlan": "libcnb._plan",
+    "BuildPlanProvide": "libcnb._plan",
+    "BuildPlanRequire": "libcnb._plan",
+    "BuildResult": "libcnb._build",
+    "detect": "libcnb._detect",
+    "DetectContext": "libcnb._detect",
+    "Detector": "libcnb._detect",
+    "DetectResult": "libcnb._detect",
+    "Environment": "libcnb._layers",
+    "ExecD": "libcnb._layers",
+    "Label": "libcnb._output",
+    "LaunchMetadata": "libcnb._output",
+    "Layer": "libcnb._layers",
+    "Layers": "libcnb._layers",
+    "License": "libcnb._buildpack",
+    "Platform": "libcnb._platform",
+    "Process": "libcnb._output",
+    "Profile": "libcnb._layers",
+    "run": "libcnb._run",
+    "Slice": "libcnb._output",
+    "Store": "libcnb._output",
+    "UnmetPlanEntry": "libcnb._output",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
 
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
 
-from libcnb._build import BuildContext, Builder, BuildResult, build
-from libcnb._buildpack import (
-    Buildpack,
-    BuildpackGroupEntry,
-    BuildpackInfo,
-    BuildpackOrder,
-    BuildpackStack,
-    License,
-)
-from libcnb._detect import DetectContext, Detector, DetectResult, detect
-from libcnb._layers import Environment, ExecD, Layer, Layers, Profile
-from libcnb._output import (
-    BOMEntry,
-    BuildMetadata,
-    Label,
-    LaunchMetadata,
-    Process,
-    Slice,
-    Store,
-    UnmetPlanEntry,
-)
-from libcnb._plan import (
-    BuildpackPlan,
-    BuildpackPlanEntry,
-    BuildPlan,
-    BuildPlanProvide,
-    BuildPlanRequire,
-)
-from libcnb._platform import Platform
-from libcnb._run import run
 
 __all__ = [
     "BOMEntry",
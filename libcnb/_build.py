@@ -1,28 +1,41 @@
 """Classes and functions related to the build phase."""
-import argparse
 import os
+import sys
 from pathlib import Path
-from typing import Any, Callable, List, Optional, Sequence, Union
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Union
 
-from packaging.version import parse
 from pydantic import BaseModel, validator
 from pydantic.fields import ModelField
 
-from libcnb._buildpack import Buildpack
+from libcnb._buildpack import MIN_BUILDPACK_API, Buildpack, _api_too_old
+from libcnb._context import _load_field, _Loaders
+from libcnb._files import _scan_dir
 from libcnb._layers import Layer, Layers
 from libcnb._output import BuildMetadata, LaunchMetadata, Store
 from libcnb._plan import BuildpackPlan
 from libcnb._platform import Platform
 
-MIN_BUILDPACK_API = parse("0.6")
 
+class _BuildArgs(NamedTuple):
+    layers: Path
+    platform: Path
+    plan: Path
 
-def _get_build_args(args: Optional[Sequence[str]] = None) -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Run the build phase of the buildpack.")
-    parser.add_argument("layers", type=Path, help="path to the layers directory")
-    parser.add_argument("platform", type=Path, help="path to the platform directory")
-    parser.add_argument("plan", type=Path, help="path to the output build plan TOML file.")
-    return parser.parse_args(args=args)
+
+def _get_build_args(args: Optional[Sequence[str]] = None) -> _BuildArgs:
+    argv = sys.argv[1:] if args is None else args
+    if len(argv) != 3:
+        raise Exception("Usage: build <layers> <platform> <plan>")
+    layers, platform, plan = argv
+    return _BuildArgs(layers=Path(layers), platform=Path(platform), plan=Path(plan))
+
+
+_LOADERS: _Loaders = {
+    Buildpack: Buildpack.from_path,
+    BuildpackPlan: BuildpackPlan.from_path,
+    Platform: Platform.from_path,
+    Store: Store.from_path,
+}
 
 
 class BuildContext(BaseModel):
@@ -50,12 +63,7 @@ class BuildContext(BaseModel):
 
     @validator("buildpack", "platform", "store", "plan", pre=True)
     def _validate_buildpack(cls, value: Union[Any, Path, str], field: ModelField) -> Any:
-        if isinstance(value, field.type_):
-            return value
-        if isinstance(value, (str, Path)):
-            path = Path(value)
-            return field.type_.from_path(path)
-        raise ValueError(f"Invalid type {type(value)} for {field.name}")
+        return _load_field(value, field, _LOADERS)
 
 
 class BuildResult(BaseModel):
@@ -84,14 +92,24 @@ class BuildResult(BaseModel):
         path = Path(path)
         for layer in self.layers:
             layer.dump()
+        outputs: Dict[str, Union[Store, LaunchMetadata, BuildMetadata]] = {
+            "store": self.store,
+            "launch": self.launch_metadata,
+            "build": self.build_metadata,
+        }
+        # Outputs with content are overwritten below, so there is no need to unlink them first.
         preserved_tomls = {layer.name for layer in self.layers}
         preserved_tomls.add("store")
-        for toml_file in path.glob("*.toml"):
-            if toml_file.stem not in preserved_tomls:
-                toml_file.unlink()
-        self.store.to_path(path / "store.toml")
-        self.launch_metadata.to_path(path / "launch.toml")
-        self.build_metadata.to_path(path / "build.toml")
+        preserved_tomls.update(name for name, output in outputs.items() if output)
+        stale_tomls = [
+            entry.path
+            for entry in _scan_dir(path)
+            if entry.name.endswith(".toml") and entry.name[:-5] not in preserved_tomls
+        ]
+        for stale_toml in stale_tomls:
+            os.unlink(stale_toml)
+        for name, output in outputs.items():
+            output.to_path(path / f"{name}.toml")
 
 
 Builder = Callable[[BuildContext], BuildResult]
@@ -117,19 +135,21 @@ def build(builder: Builder) -> None:
     except KeyError:
         raise Exception("CNB_BUILDPACK_DIR is not set")
 
-    context = BuildContext(
-        application_dir=Path(".").absolute(),
-        buildpack=buildpack_dir,  # type: ignore
-        platform=args.platform,
+    buildpack = Buildpack.from_path(buildpack_dir)
+    if _api_too_old(buildpack.api):
+        raise Exception(
+            f"This version of libcnb is only compatible with buildpack API {MIN_BUILDPACK_API} or greater"
+        )
+
+    context = BuildContext.construct(
+        application_dir=Path(os.getcwd()),
+        buildpack=buildpack,
+        platform=Platform.from_path(args.platform),
         layers=Layers(path=args.layers),
-        plan=args.plan,
-        store=(args.layers / "store.toml"),
+        plan=BuildpackPlan.from_path(args.plan),
+        store=Store.from_path(args.layers / "store.toml"),
         stack_id=stack_id,
     )
-    if parse(context.buildpack.api) < MIN_BUILDPACK_API:
-        raise Exception(
-            "This version of libcnb is only compatible with buildpack API 0.6 or greater"
-        )
     result = builder(context)
     result.to_path(args.layers)
     return
@@ -1,12 +1,36 @@
 """Classes and functions related to the buildpack specific information and metadata."""
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Type, Union
 
-import toml
 from pydantic import BaseModel, Field
 
+from libcnb import _toml
+from libcnb._model import _construct
 
-class License(BaseModel):
+MIN_BUILDPACK_API = "0.6"
+_MIN_BUILDPACK_API_VERSION = tuple(map(int, MIN_BUILDPACK_API.split(".")))
+
+
+@lru_cache(maxsize=16)
+def _api_too_old(api: str) -> bool:
+    # Buildpack API versions are plain <major>.<minor> strings, compared numerically.
+    try:
+        version = tuple(map(int, api.split(".")))
+    except ValueError:
+        raise Exception(
+            f"Unsupported buildpack API {api!r}, this version of libcnb is only compatible "
+            f"with buildpack API {MIN_BUILDPACK_API} or greater"
+        )
+    return version < _MIN_BUILDPACK_API_VERSION
+
+
+class _BuildpackModel(BaseModel):
+    class Config:  # noqa: D101, D106
+        allow_population_by_field_name = True
+
+
+class License(_BuildpackModel):
     """License contains information about a Software License governing the use or redistribution of a buildpack.
 
     Attributes:
@@ -20,11 +44,8 @@ class License(BaseModel):
     type_: str = Field(alias="type", default="")
     uri: str = ""
 
-    class Config:  # noqa: D101, D106
-        allow_population_by_field_name = True
-
 
-class BuildpackInfo(BaseModel):
+class BuildpackInfo(_BuildpackModel):
     """BuildpackInfo is information about the buildpack.
 
     Attributes:
@@ -49,7 +70,7 @@ class BuildpackInfo(BaseModel):
     licenses: List[License] = []
 
 
-class BuildpackStack(BaseModel):
+class BuildpackStack(_BuildpackModel):
     """BuildpackStack is a stack supported by the buildpack.
 
     Attributes:
@@ -61,7 +82,7 @@ class BuildpackStack(BaseModel):
     mixins: List[str] = []
 
 
-class BuildpackGroupEntry(BaseModel):
+class BuildpackGroupEntry(_BuildpackModel):
     """BuildpackGroupEntry is a buildpack within in a buildpack order group.
 
     Attributes:
@@ -75,7 +96,7 @@ class BuildpackGroupEntry(BaseModel):
     optional: bool = False
 
 
-class BuildpackOrder(BaseModel):
+class BuildpackOrder(_BuildpackModel):
     """BuildpackOrder is an order definition in the buildpack.
 
     Attributes:
@@ -85,7 +106,7 @@ class BuildpackOrder(BaseModel):
     group: List[BuildpackGroupEntry] = []
 
 
-class Buildpack(BaseModel):
+class Buildpack(_BuildpackModel):
     """Buildpack is the contents of the buildpack.toml file.
 
     Attributes:
@@ -105,9 +126,50 @@ class Buildpack(BaseModel):
     order: List[BuildpackOrder] = []
 
     @classmethod
-    def from_path(cls, path: Union[str, Path]) -> "Buildpack":
-        """Loads the buildpack information given a path on disk."""
-        path = Path(path)
-        data = toml.loads((path / "buildpack.toml").read_text())
-        data["path"] = path.absolute()
+    def from_path(cls, path: Union[str, Path], validate: bool = False) -> "Buildpack":
+        """Loads the buildpack information given a path on disk.
+
+        The result is cached per path for the lifetime of the process, since buildpack.toml
+        does not change while the buildpack runs. Every call for the same path returns the same
+        instance, so it should not be modified.
+
+        Arguments:
+            path: Path to the buildpack directory containing the buildpack.toml.
+            validate: If set to True, the contents of buildpack.toml are validated against
+                the model. By default buildpack.toml is trusted and loaded without validation,
+                which is considerably faster.
+        """
+        return _load_buildpack(cls, Path(path).absolute(), validate)
+
+
+def _has_required_keys(data: Dict[str, Any]) -> bool:
+    info = data.get("buildpack")
+    return "api" in data and isinstance(info, dict) and "id" in info and "version" in info
+
+
+@lru_cache(maxsize=4)
+def _load_buildpack(cls: Type[Buildpack], path: Path, validate: bool) -> Buildpack:
+    data = _toml.load(path / "buildpack.toml")
+    data["path"] = path
+    # An incomplete buildpack.toml is validated so the error names the missing field.
+    if validate or not _has_required_keys(data):
         return cls.parse_obj(data)
+    info = data["buildpack"]
+    return _construct(
+        cls,
+        data,
+        info=_construct(
+            BuildpackInfo,
+            info,
+            licenses=[_construct(License, license) for license in info.get("licenses", [])],
+        ),
+        stacks=[_construct(BuildpackStack, stack) for stack in data.get("stacks", [])],
+        order=[
+            _construct(
+                BuildpackOrder,
+                order,
+                group=[_construct(BuildpackGroupEntry, entry) for entry in order.get("group", [])],
+            )
+            for order in data.get("order", [])
+        ],
+    )
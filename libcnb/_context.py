@@ -0,0 +1,17 @@
+"""Helpers shared by the build and detect phase contexts."""
+from pathlib import Path
+from typing import Any, Callable, Mapping, Type, Union
+
+from pydantic import BaseModel
+from pydantic.fields import ModelField
+
+_Loaders = Mapping[Type[BaseModel], Callable[[Union[str, Path]], BaseModel]]
+
+
+def _load_field(value: Union[Any, Path, str], field: ModelField, loaders: _Loaders) -> Any:
+    """Loads a context field from a path, passing through values of the right type."""
+    if isinstance(value, field.type_):
+        return value
+    if isinstance(value, (str, Path)):
+        return loaders[field.type_](value)
+    raise ValueError(f"Invalid type {type(value)} for {field.name}")
@@ -1,27 +1,36 @@
 """Classes and functions related to the detect phase."""
-import argparse
 import os
 import sys
 from pathlib import Path
-from typing import Any, Callable, List, Optional, Sequence, Union
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence, Union
 
-import toml
-from packaging.version import parse
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, validator
 from pydantic.fields import ModelField
 
-from libcnb._buildpack import Buildpack
-from libcnb._plan import BuildPlan, BuildPlanProvide, BuildPlanRequire
+from libcnb import _toml
+from libcnb._buildpack import MIN_BUILDPACK_API, Buildpack, _api_too_old
+from libcnb._context import _load_field, _Loaders
+from libcnb._plan import BuildPlan
 from libcnb._platform import Platform
 
-MIN_BUILDPACK_API = parse("0.6")
 
+class _DetectArgs(NamedTuple):
+    platform: Path
+    plan: Path
 
-def _get_detect_args(args: Optional[Sequence[str]] = None) -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Detect if the buildpack should be run.")
-    parser.add_argument("platform", type=Path, help="path to the platform directory")
-    parser.add_argument("plan", type=Path, help="path to the output build plan TOML file.")
-    return parser.parse_args(args=args)
+
+def _get_detect_args(args: Optional[Sequence[str]] = None) -> _DetectArgs:
+    argv = sys.argv[1:] if args is None else args
+    if len(argv) != 2:
+        raise Exception("Usage: detect <platform> <plan>")
+    platform, plan = argv
+    return _DetectArgs(platform=Path(platform), plan=Path(plan))
+
+
+_LOADERS: _Loaders = {
+    Buildpack: Buildpack.from_path,
+    Platform: Platform.from_path,
+}
 
 
 class DetectContext(BaseModel):
@@ -41,12 +50,7 @@ class DetectContext(BaseModel):
 
     @validator("buildpack", "platform", pre=True)
     def _validate_buildpack(cls, value: Union[Any, Path, str], field: ModelField) -> Any:
-        if isinstance(value, field.type_):
-            return value
-        if isinstance(value, (str, Path)):
-            path = Path(value).absolute()
-            return field.type_.from_path(path)
-        raise ValueError(f"Invalid type {type(value)} for {field.name}")
+        return _load_field(value, field, _LOADERS)
 
 
 class DetectResult(BaseModel):
@@ -64,23 +68,8 @@ class DetectResult(BaseModel):
 Detector = Callable[[DetectContext], DetectResult]
 
 
-class _BuildPlans(BaseModel):
-    provides: List[BuildPlanProvide]
-    requires: List[BuildPlanRequire]
-    or_: List[BuildPlan] = Field(alias="or", default=[])
-
-    class Config:  # noqa: D101, D106
-        allow_population_by_field_name = True
-
-
 def _export_build_plans(plans: List[BuildPlan], path: Path) -> None:
-    path.write_text(
-        toml.dumps(
-            _BuildPlans(provides=plans[0].provides, requires=plans[0].requires, or_=plans[1:]).dict(
-                by_alias=True
-            )
-        )
-    )
+    _toml.dump({**plans[0].dict(), "or": [plan.dict() for plan in plans[1:]]}, path)
 
 
 def detect(detector: Detector) -> None:
@@ -103,16 +92,18 @@ def detect(detector: Detector) -> None:
     except KeyError:
         raise Exception("CNB_BUILDPACK_DIR is not set")
 
-    context = DetectContext(
-        application_dir=Path(".").absolute(),
-        buildpack=buildpack_dir,  # type: ignore
-        platform=args.platform,
-        stack_id=stack_id,
-    )
-    if parse(context.buildpack.api) < MIN_BUILDPACK_API:
+    buildpack = Buildpack.from_path(buildpack_dir)
+    if _api_too_old(buildpack.api):
         raise Exception(
             f"This version of libcnb is only compatible with buildpack API {MIN_BUILDPACK_API} or greater"
         )
+
+    context = DetectContext.construct(
+        application_dir=Path(os.getcwd()),
+        buildpack=buildpack,
+        platform=Platform.from_path(args.platform),
+        stack_id=stack_id,
+    )
     result = detector(context)
     if not result.passed:
         sys.exit(100)
@@ -0,0 +1,23 @@
+"""Helpers for reading the files and directories exchanged with the lifecycle."""
+import os
+from pathlib import Path
+from typing import List, Union
+
+
+def _abs(path: Path) -> Path:
+    # Path.absolute() calls os.getcwd(), which is wasted on paths that are already absolute.
+    return path if path.is_absolute() else path.absolute()
+
+
+def _scan_dir(path: Union[str, Path]) -> List["os.DirEntry[str]"]:
+    """Lists the entries of a directory, treating a missing directory as empty."""
+    try:
+        with os.scandir(path) as entries:
+            return list(entries)
+    except FileNotFoundError:
+        return []
+
+
+def _read_file(path: str) -> str:
+    with open(path, encoding="utf-8") as file:
+        return file.read()
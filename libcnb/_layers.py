@@ -1,13 +1,36 @@
 """Classes and functions related to layer metadata manipulation."""
-import shutil
+import os
 from collections import UserDict
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import Any, Dict, Mapping, Union
 
-import toml
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, validator
 
-LAYER_TYPES = {"launch", "cache", "build"}
+from libcnb import _toml
+from libcnb._files import _abs, _read_file, _scan_dir
+
+_ENV_SUFFIXES = (".append", ".prepend", ".default", ".delim", ".override")
+_PARALLEL_LOAD_THRESHOLD = 4
+_PARALLEL_LOAD_WORKERS = 8
+_MISSING = object()
+
+
+def _write_files(path: Union[str, Path], files: Mapping[str, Any]) -> None:
+    """Writes each value to a file named after its key inside the given directory."""
+    os.makedirs(path, mode=0o755, exist_ok=True)
+    if os.open not in os.supports_dir_fd:  # pragma: no cover
+        for name, value in files.items():
+            with open(os.path.join(path, name), "wb") as file:
+                file.write(str(value).encode())
+        return
+    dir_fd = os.open(path, os.O_RDONLY)
+    try:
+        for name, value in files.items():
+            fd = os.open(name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644, dir_fd=dir_fd)
+            with open(fd, "wb") as file:
+                file.write(str(value).encode())
+    finally:
+        os.close(dir_fd)
 
 
 class Profile(UserDict):  # type: ignore
@@ -25,19 +48,15 @@ class Profile(UserDict):  # type: ignore
     @classmethod
     def from_path(cls, profile_path: Union[Path, str]) -> "Profile":
         """Loads a collection of profile.d scripts from disk."""
-        profile_path = Path(profile_path)
         profile = cls()
-        for path in profile_path.glob("*"):
-            if path.is_file():
-                profile.add(path.name, path.read_text())
+        for entry in _scan_dir(profile_path):
+            if entry.is_file():
+                profile.add(entry.name, _read_file(entry.path))
         return profile
 
     def to_path(self, path: Union[Path, str]) -> None:
         """Exports the current collection of profile.d scripts to disk."""
-        path = Path(path)
-        path.mkdir(mode=0o755, parents=True, exist_ok=True)
-        for key, value in self.items():
-            (path / key).write_text(str(value))
+        _write_files(path, self.data)
 
 
 class Environment(UserDict):  # type: ignore
@@ -86,25 +105,15 @@ class Environment(UserDict):  # type: ignore
     @classmethod
     def from_path(cls, env_path: Union[Path, str]) -> "Environment":
         """Loads the environment from the given path on disk."""
-        env_path = Path(env_path)
         env = cls()
-        for path in env_path.glob("*"):
-            if path.is_file() and path.suffix in {
-                ".append",
-                ".prepend",
-                ".default",
-                ".delim",
-                ".override",
-            }:
-                env[path.name] = path.read_text()
+        for entry in _scan_dir(env_path):
+            if entry.is_file() and entry.name.endswith(_ENV_SUFFIXES):
+                env[entry.name] = _read_file(entry.path)
         return env
 
     def to_path(self, path: Union[Path, str]) -> None:
         """Exports the environment to the given path on disk."""
-        path = Path(path)
-        path.mkdir(mode=0o755, parents=True, exist_ok=True)
-        for key, value in self.items():
-            (path / key).write_text(str(value))
+        _write_files(path, self.data)
 
 
 class ExecD:
@@ -120,7 +129,7 @@ class ExecD:
 
     def file_path(self, name: str) -> Path:
         """Returns the fully qualified file path for a given name."""
-        return (self.path / name).absolute()
+        return _abs(self.path / name)
 
     def process_file_path(self, process: str, name: str) -> Path:
         """Returns the fully qualified file path for a given process type and name."""
@@ -177,13 +186,13 @@ class Layer(BaseModel):
     build: bool = False
     launch: bool = False
     cache: bool = False
-    shared_env: Environment = Environment()
-    launch_env: Environment = Environment()
-    build_env: Environment = Environment()
-    process_launch_envs: Dict[str, Environment] = {}
-    metadata: Dict[str, Any] = {}
-    profile: Profile = Profile()
-    process_profiles: Dict[str, Profile] = {}
+    shared_env: Environment = Field(default_factory=Environment)
+    launch_env: Environment = Field(default_factory=Environment)
+    build_env: Environment = Field(default_factory=Environment)
+    process_launch_envs: Dict[str, Environment] = Field(default_factory=dict)
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+    profile: Profile = Field(default_factory=Profile)
+    process_profiles: Dict[str, Profile] = Field(default_factory=dict)
 
     class Config:  # noqa: D101, D106
         arbitrary_types_allowed = True
@@ -194,7 +203,7 @@ class Layer(BaseModel):
 
     @property
     def metadata_file(self) -> Path:  # noqa: D102
-        return Path(f"{self.path}.toml").absolute()
+        return _abs(Path(f"{self.path}.toml"))
 
     @property
     def exec_d(self) -> ExecD:  # noqa: D102
@@ -203,38 +212,58 @@ class Layer(BaseModel):
     def load(self, load_all: bool = False) -> "Layer":
         """Loads the layer metadata from disk if it exists."""
         try:
-            metadata = toml.loads(self.metadata_file.read_text())
+            metadata = _toml.load(self.metadata_file)
         except FileNotFoundError:
             metadata = {}
         layer_types = metadata.get("types", {})
-        for layer_type in LAYER_TYPES:
-            setattr(self, layer_type, layer_types.get(layer_type, False))
+        self.build = layer_types.get("build", False)
+        self.launch = layer_types.get("launch", False)
+        self.cache = layer_types.get("cache", False)
         self.metadata = metadata.get("metadata", {})
         if not load_all:
             return self
-        self.shared_env = Environment.from_path(self.path / "env")
-        self.build_env = Environment.from_path(self.path / "env.build")
-        launch_env_path = self.path / "env.launch"
-        self.launch_env = Environment.from_path(launch_env_path)
-        self.process_launch_envs = {}
-        for path in launch_env_path.glob("*"):
-            if path.is_dir():
-                self.process_launch_envs[path.name] = Environment.from_path(path)
-        self.profile = Profile.from_path(self.path / "profile.d")
-        self.process_profiles = {}
-        for path in (self.path / "profile.d").glob("*"):
-            if path.is_dir():
-                self.process_profiles[path.name] = Profile.from_path(path)
+        launch_env_path = os.path.join(self.path, "env.launch")
+        profile_path = os.path.join(self.path, "profile.d")
+        process_env_dirs = [entry for entry in _scan_dir(launch_env_path) if entry.is_dir()]
+        process_profile_dirs = [entry for entry in _scan_dir(profile_path) if entry.is_dir()]
+        env_paths = [
+            os.path.join(self.path, "env"),
+            os.path.join(self.path, "env.build"),
+            launch_env_path,
+        ]
+        env_paths.extend(entry.path for entry in process_env_dirs)
+        profile_paths = [profile_path]
+        profile_paths.extend(entry.path for entry in process_profile_dirs)
+        # Reading the files is I/O bound, so layers with many process specific directories are
+        # loaded on a thread pool, while small layers avoid the cost of starting one.
+        if len(process_env_dirs) + len(process_profile_dirs) > _PARALLEL_LOAD_THRESHOLD:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=_PARALLEL_LOAD_WORKERS) as executor:
+                env_results = executor.map(Environment.from_path, env_paths)
+                profile_results = executor.map(Profile.from_path, profile_paths)
+                envs, profiles = list(env_results), list(profile_results)
+        else:
+            envs = [Environment.from_path(env_path) for env_path in env_paths]
+            profiles = [Profile.from_path(profile_path) for profile_path in profile_paths]
+        self.shared_env, self.build_env, self.launch_env = envs[:3]
+        self.process_launch_envs = {
+            entry.name: env for entry, env in zip(process_env_dirs, envs[3:])
+        }
+        self.profile = profiles[0]
+        self.process_profiles = {
+            entry.name: profile for entry, profile in zip(process_profile_dirs, profiles[1:])
+        }
         return self
 
     def dump(self) -> None:
         """Exports the layer metadata to disk."""
         self.path.mkdir(parents=True, exist_ok=True)
         metadata = {
-            "types": {key: getattr(self, key) for key in LAYER_TYPES},
+            "types": {"launch": self.launch, "cache": self.cache, "build": self.build},
             "metadata": self.metadata,
         }
-        self.metadata_file.write_text(toml.dumps(metadata))
+        _toml.dump(metadata, self.metadata_file)
         self.shared_env.to_path(self.path / "env")
         self.build_env.to_path(self.path / "env.build")
         self.launch_env.to_path(self.path / "env.launch")
@@ -249,6 +278,8 @@ class Layer(BaseModel):
         if self.metadata_file.exists():
             self.metadata_file.unlink()
         if self.path.exists():
+            import shutil
+
             shutil.rmtree(self.path)
         self.path.mkdir(parents=True, exist_ok=True)
         return self.load(load_all=True)
@@ -263,15 +294,9 @@ class Layer(BaseModel):
                 against the actual metadata. Any extra keys in actual metadata are ignored.
         """
         if exact:
-            if self.metadata != expected_metadata:
-                return False
-            return True
-        for key, value in expected_metadata.items():
-            if key not in self.metadata:
-                return False
-            if self.metadata[key] != value:
-                return False
-        return True
+            return self.metadata == expected_metadata
+        metadata = self.metadata
+        return all(metadata.get(key, _MISSING) == value for key, value in expected_metadata.items())
 
 
 class Layers(BaseModel):
@@ -283,6 +308,10 @@ class Layers(BaseModel):
 
     path: Path
 
+    @validator("path")
+    def _absolute_path(cls, value: Path) -> Path:
+        return _abs(value)
+
     def get(self, name: str, load_all: bool = False) -> Layer:
         """Create or load a layer with the given name along with its metadata.
 
@@ -291,4 +320,4 @@ class Layers(BaseModel):
             load_all: If set to True, also loads the environment and profile.d values
                 associated with the layer.
         """
-        return Layer(path=(self.path / name).absolute()).load(load_all=load_all)
+        return Layer.construct(path=_abs(self.path / name)).load(load_all=load_all)
@@ -0,0 +1,24 @@
+"""Helpers for creating models from trusted data."""
+from functools import lru_cache
+from typing import Any, Mapping, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+_Model = TypeVar("_Model", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def _field_aliases(model: Type[BaseModel]) -> Tuple[Tuple[str, str], ...]:
+    return tuple((name, field.alias) for name, field in model.__fields__.items())
+
+
+def _construct(model: Type[_Model], data: Mapping[str, Any], **values: Any) -> _Model:
+    """Creates a model from trusted data without validating it.
+
+    Keys in data are looked up by field alias, unknown keys are dropped and
+    any explicitly passed values take precedence over the ones in data.
+    """
+    for name, alias in _field_aliases(model):
+        if name not in values and alias in data:
+            values[name] = data[alias]
+    return model.construct(**values)
@@ -2,9 +2,10 @@
 from pathlib import Path
 from typing import Any, Dict, List, Union
 
-import toml
 from pydantic import BaseModel, Field, validator
 
+from libcnb import _toml
+
 
 class Process(BaseModel):
     """Process represents metadata about a type of command that can be run.
@@ -26,6 +27,15 @@ class Process(BaseModel):
     class Config:  # noqa: D101, D106
         allow_population_by_field_name = True
 
+    def _as_dict(self) -> Dict[str, Any]:
+        return {
+            "type": self.type_,
+            "command": self.command,
+            "args": self.args,
+            "direct": self.direct,
+            "default": self.default,
+        }
+
 
 class Label(BaseModel):
     """Label represents an image label.
@@ -38,6 +48,9 @@ class Label(BaseModel):
     key: str
     value: str
 
+    def _as_dict(self) -> Dict[str, Any]:
+        return {"key": self.key, "value": self.value}
+
 
 class Slice(BaseModel):
     """Slice represents metadata about a slice.
@@ -52,6 +65,9 @@ class Slice(BaseModel):
     def _convert_paths(cls, value: Any) -> List[str]:
         return [str(path) for path in value]
 
+    def _as_dict(self) -> Dict[str, Any]:
+        return {"paths": self.paths}
+
 
 class BOMEntry(BaseModel):
     """BOMEntry contains a bill of materials entry.
@@ -64,6 +80,9 @@ class BOMEntry(BaseModel):
     name: str
     metadata: Dict[str, Any] = {}
 
+    def _as_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "metadata": self.metadata}
+
 
 class UnmetPlanEntry(BaseModel):
     """UnmetPlanEntry denotes an unmet buildpack plan entry.
@@ -77,6 +96,9 @@ class UnmetPlanEntry(BaseModel):
 
     name: str
 
+    def _as_dict(self) -> Dict[str, Any]:
+        return {"name": self.name}
+
 
 class LaunchMetadata(BaseModel):
     """LaunchMetadata represents the contents of launch.toml.
@@ -95,13 +117,23 @@ class LaunchMetadata(BaseModel):
 
     def to_path(self, path: Union[str, Path]) -> None:
         """Export LaunchMetadata to the TOML file at the given path."""
-        if self:
-            Path(path).write_text(toml.dumps(self.dict(by_alias=True)))
+        if not self:
+            return
+        _toml.dump(self._as_dict(), path)
+
+    def _as_dict(self) -> Dict[str, Any]:
+        # Builds the same dict as self.dict(by_alias=True) without walking the model graph.
+        return {
+            "labels": [label._as_dict() for label in self.labels],
+            "processes": [process._as_dict() for process in self.processes],
+            "slices": [slice_._as_dict() for slice_ in self.slices],
+            "bom": [entry._as_dict() for entry in self.bom],
+        }
 
     @classmethod
     def from_path(cls, path: Union[str, Path]) -> "LaunchMetadata":
         """Creates a LaunchMetadata from the TOML file at the given path."""
-        return cls.parse_obj(toml.loads(Path(path).read_text()))
+        return cls.parse_obj(_toml.load(path))
 
     def __bool__(self) -> bool:
         """Returns true if there is any content to be written to the output toml file."""
@@ -121,13 +153,20 @@ class BuildMetadata(BaseModel):
 
     def to_path(self, path: Union[str, Path]) -> None:
         """Export LaunchMetadata to the TOML file at the given path."""
-        if self:
-            Path(path).write_text(toml.dumps(self.dict(by_alias=True)))
+        if not self:
+            return
+        _toml.dump(self._as_dict(), path)
+
+    def _as_dict(self) -> Dict[str, Any]:
+        return {
+            "bom": [entry._as_dict() for entry in self.bom],
+            "unmet": [entry._as_dict() for entry in self.unmet],
+        }
 
     @classmethod
     def from_path(cls, path: Union[str, Path]) -> "BuildMetadata":
         """Creates a BuildMetadata from the TOML file at the given path."""
-        return cls.parse_obj(toml.loads(Path(path).read_text()))
+        return cls.parse_obj(_toml.load(path))
 
     def __bool__(self) -> bool:
         """Returns true if there is any content to be written to the output toml file."""
@@ -145,16 +184,21 @@ class Store(BaseModel):
 
     def to_path(self, path: Union[str, Path]) -> None:
         """Export Store to the TOML file at the given path."""
-        if self:
-            Path(path).write_text(toml.dumps(self.dict(by_alias=True)))
+        if not self:
+            return
+        _toml.dump(self._as_dict(), path)
+
+    def _as_dict(self) -> Dict[str, Any]:
+        return {"metadata": self.metadata}
 
     @classmethod
     def from_path(cls, path: Union[str, Path]) -> "Store":
         """Creates a Store from the TOML file at the given path."""
-        path = Path(path)
-        if not path.exists():
+        try:
+            data = _toml.load(path)
+        except FileNotFoundError:
             return cls()
-        return cls.parse_obj(toml.loads(path.read_text()))
+        return cls.parse_obj(data)
 
     def __bool__(self) -> bool:
         """Returns true if there is any content to be written to the output toml file."""
@@ -2,9 +2,11 @@
 from pathlib import Path
 from typing import Any, Dict, List, Union
 
-import toml
 from pydantic import BaseModel
 
+from libcnb import _toml
+from libcnb._model import _construct
+
 
 class BuildPlanProvide(BaseModel):
     """BuildPlanProvide represents a dependency provided by a buildpack.
@@ -63,5 +65,13 @@ class BuildpackPlan(BaseModel):
 
     @classmethod
     def from_path(cls, path: Union[Path, str]) -> "BuildpackPlan":
-        """Loads a buildpack plan from the path to a TOML file."""
-        return cls.parse_obj(toml.loads(Path(path).read_text()))
+        """Loads a buildpack plan from the path to a TOML file.
+
+        The plan is written by the lifecycle, so it is trusted and loaded without validation.
+        """
+        data = _toml.load(path)
+        return _construct(
+            cls,
+            data,
+            entries=[_construct(BuildpackPlanEntry, entry) for entry in data.get("entries", [])],
+        )
@@ -1,10 +1,13 @@
 """Classes and functions binding the Platform metadata."""
+import os
 from pathlib import Path
 from types import MappingProxyType
 from typing import Dict, Mapping, Union
 
 from pydantic import BaseModel, Field
 
+from libcnb._files import _abs, _read_file, _scan_dir
+
 _EMPTY_MAP: Mapping[str, str] = MappingProxyType({})
 
 
@@ -25,9 +28,9 @@ class Platform(BaseModel):
     @classmethod
     def from_path(cls, path: Union[str, Path]) -> "Platform":
         """Construct a Platform object from a given path."""
-        path = Path(path).absolute()
+        path = _abs(Path(path))
         env: Dict[str, str] = {}
-        for env_path in (path / "env").glob("*"):
-            if env_path.is_file():
-                env[env_path.name] = env_path.read_text()
-        return cls(path=path, env=MappingProxyType(env))
+        for entry in _scan_dir(os.path.join(path, "env")):
+            if entry.is_file():
+                env[entry.name] = _read_file(entry.path)
+        return cls.construct(path=path, env=MappingProxyType(env))
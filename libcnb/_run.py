@@ -1,16 +1,18 @@
 """The primary entrypoint for the build and detect phases."""
+import os
 import sys
-from pathlib import Path
+from typing import TYPE_CHECKING
 
-from libcnb._build import Builder, build
-from libcnb._detect import Detector, detect
+if TYPE_CHECKING:  # pragma: no cover
+    from libcnb._build import Builder
+    from libcnb._detect import Detector
 
 
 def _get_executable_type() -> str:
-    return Path(sys.argv[0]).name
+    return os.path.basename(sys.argv[0])
 
 
-def run(detector: Detector, builder: Builder) -> None:
+def run(detector: "Detector", builder: "Builder") -> None:
     """Combines the invocation of both build and detect into a single entry point.
 
     Calling run from an executable with a name matching "detect" or
@@ -26,9 +28,20 @@ def run(detector: Detector, builder: Builder) -> None:
             that performs the specific detect phase operations for a buildpack. It should be
             a callable that takes in a BuildContext and returns a BuildResult.
     """
+    # Only the phase being run is imported, which keeps the other one out of the process startup.
+    def _build() -> None:
+        from libcnb._build import build
+
+        build(builder)
+
+    def _detect() -> None:
+        from libcnb._detect import detect
+
+        detect(detector)
+
     executable_type = _get_executable_type()
-    if executable_type == "build":
-        return build(builder)
-    elif executable_type == "detect":
-        return detect(detector)
-    raise Exception(f"{executable_type} is not a supported executable type.")
+    phases = {"build": _build, "detect": _detect}
+    phase = phases.get(executable_type)
+    if phase is None:
+        raise Exception(f"{executable_type} is not a supported executable type.")
+    return phase()
@@ -0,0 +1,47 @@
+"""Helpers for reading and writing the TOML files exchanged with the lifecycle."""
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Union
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+
+def load(path: Union[str, Path]) -> Dict[str, Any]:
+    """Parses the TOML file at the given path."""
+    with open(path, "rb") as toml_file:
+        return tomllib.load(toml_file)
+
+
+def _drop_none(value: Any) -> Any:
+    # TOML has no null, keys set to None are left out of the file.
+    if isinstance(value, dict):
+        return {key: _drop_none(item) for key, item in value.items() if item is not None}
+    if isinstance(value, list):
+        return [_drop_none(item) for item in value]
+    return value
+
+
+def dump(data: Dict[str, Any], path: Union[str, Path]) -> None:
+    """Serializes data as TOML to the given path.
+
+    Keys whose value is None are omitted, since TOML cannot represent them. The file is
+    written next to its destination and moved into place, so a failed write never leaves
+    a partial TOML file behind.
+    """
+    # Only the phases that write outputs need the writer, so it is imported on first use.
+    import tomli_w
+
+    content = tomli_w.dumps(_drop_none(data)).encode()
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "wb") as toml_file:
+            toml_file.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
@@ -0,0 +1,3 @@
+"""The version of libcnb, overwritten by the publish workflows on release."""
+
+__version__ = "0.0.0"
@@ -1,18 +1,36 @@
+import os
+import shutil
+import sys
 from pathlib import Path
 
 import pytest
 
 import libcnb
 
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+TESTDATA = Path(__file__).parent / "testdata"
+
+
+def load_toml(path):
+    # Reads TOML independently of libcnb, so assertions don't rely on the code under test.
+    with open(path, "rb") as toml_file:
+        return tomllib.load(toml_file)
+
 
 @pytest.fixture
 def mock_layers(tmp_path):
     yield libcnb.Layers(path=tmp_path)
 
 
-@pytest.fixture
-def mock_layer(mock_layers):
-    layer: libcnb.Layer = mock_layers.get("test")
+@pytest.fixture(scope="session")
+def shared_layer(tmp_path_factory):
+    # Populated once per session and must not be modified, tests that change it use mock_layer.
+    layers = libcnb.Layers(path=tmp_path_factory.mktemp("layers"))
+    layer: libcnb.Layer = layers.get("test")
     layer.launch = True
     layer.cache = True
     layer.metadata["test"] = 1
@@ -25,22 +43,71 @@ def mock_layer(mock_layers):
     layer.process_launch_envs["process"] = libcnb.Environment({"TEST.default": "1"})
     layer.process_profiles["process"] = libcnb.Profile({"test": "test"})
     layer.dump()
-    yield layer, layer.name, mock_layers
+    yield layer, layer.name, layers
 
 
 @pytest.fixture
+def mock_layer(shared_layer, tmp_path):
+    _, layer_name, shared_layers = shared_layer
+    shutil.copytree(shared_layers.path, tmp_path / "layers")
+    mock_layers = libcnb.Layers(path=tmp_path / "layers")
+    yield mock_layers.get(layer_name, load_all=True), layer_name, mock_layers
+
+
+@pytest.fixture(scope="session")
+def shared_tmp_dir(tmp_path_factory):
+    # Output files written here must be named uniquely per test, e.g. after request.node.name.
+    # The directory lives under the pytest temp root, which can be moved to memory by running
+    # the suite with TMPDIR=/dev/shm where it is available.
+    yield tmp_path_factory.mktemp("libcnb-out")
+
+
+@pytest.fixture(scope="session")
 def mock_platform_path():
-    yield Path("tests") / "testdata" / "platform"
+    yield TESTDATA / "platform"
 
 
-@pytest.fixture
-def mock_buildpack_path():
-    yield Path("tests") / "testdata" / "buildpack"
+@pytest.fixture(scope="session")
+def mock_platform(mock_platform_path):
+    yield libcnb.Platform.from_path(mock_platform_path)
 
 
-@pytest.fixture
-def mock_old_buildpack_path():
-    yield Path("tests") / "testdata" / "old_buildpack"
+@pytest.fixture(scope="session")
+def mock_buildpack_path():
+    yield TESTDATA / "buildpack"
+
+
+@pytest.fixture(scope="session")
+def mock_buildpack(mock_buildpack_path):
+    yield libcnb.Buildpack.from_path(mock_buildpack_path)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def cnb_env(mock_buildpack_path):
+    # Set once for the whole session, tests that need a different value patch it with monkeypatch.
+    env = {"CNB_STACK_ID": "test", "CNB_BUILDPACK_DIR": str(mock_buildpack_path)}
+    original = {name: os.environ.get(name) for name in env}
+    os.environ.update(env)
+    yield env
+    for name, value in original.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+
+
+@pytest.fixture(scope="session")
+def base_build_context_input(mock_buildpack, mock_platform, tmp_path_factory):
+    # Shared between tests, take a copy with {**base_build_context_input, ...} to change values.
+    yield {
+        "application_dir": Path(".").absolute(),
+        "layers": libcnb.Layers(path=tmp_path_factory.mktemp("context") / "layers"),
+        "store": libcnb.Store(),
+        "plan": libcnb.BuildpackPlan(),
+        "buildpack": mock_buildpack,
+        "platform": mock_platform,
+        "stack_id": "test",
+    }
 
 
 @pytest.fixture
@@ -48,6 +115,26 @@ def mock_buildpack_plan_path(tmp_path):
     yield tmp_path / "plan.toml"
 
 
-@pytest.fixture
-def mock_plan(tmp_path):
-    yield Path("tests") / "testdata" / "plan.toml"
+@pytest.fixture(scope="session")
+def mock_plan():
+    yield TESTDATA / "plan.toml"
+
+
+@pytest.fixture(scope="session")
+def mock_store_path():
+    yield TESTDATA / "store.toml"
+
+
+@pytest.fixture(scope="session")
+def mock_store(mock_store_path):
+    yield libcnb.Store.from_path(mock_store_path)
+
+
+@pytest.fixture(scope="session")
+def mock_launch_path():
+    yield TESTDATA / "launch.toml"
+
+
+@pytest.fixture(scope="session")
+def mock_build_path():
+    yield TESTDATA / "build.toml"
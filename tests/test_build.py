@@ -1,10 +1,10 @@
-import sys
 from pathlib import Path
+from typing import NamedTuple
 
 import pytest
-import toml
 
 import libcnb
+from tests.conftest import TESTDATA, load_toml
 
 
 @pytest.fixture
@@ -19,21 +19,23 @@ def mock_build_context(
     monkeypatch.setattr(
         "sys.argv", ["build", str(mock_layers), str(mock_platform_path), str(mock_plan)]
     )
-    monkeypatch.setenv("CNB_BUILDPACK_DIR", str(mock_buildpack_path))
-    monkeypatch.setenv("CNB_STACK_ID", "test")
     yield mock_layers, mock_platform_path, mock_plan, mock_buildpack_path, "test"
 
 
-def test_build_values(mock_build_context):
-    # GIVEN
-    layers_path, platform_path, plan, buildpack_path, stack_id = mock_build_context
+class _ExpectedContext(NamedTuple):
+    layers_path: Path
+    platform_path: Path
+    buildpack_path: Path
+    stack_id: str
 
+
+def _make_builder(expected: _ExpectedContext):
     def builder(context: libcnb.BuildContext):
         assert context.application_dir == Path(".").absolute()
-        assert context.layers.path == layers_path
-        assert context.platform.path == platform_path.absolute()
-        assert context.buildpack.path == buildpack_path.absolute()
-        assert context.stack_id == stack_id
+        assert context.layers.path == expected.layers_path
+        assert context.platform.path == expected.platform_path.absolute()
+        assert context.buildpack.path == expected.buildpack_path.absolute()
+        assert context.stack_id == expected.stack_id
         layer = context.layers.get("test")
         another_layer = context.layers.get("test-another")
         another_layer.dump()
@@ -57,16 +59,23 @@ def test_build_values(mock_build_context):
             ),
         )
 
+    return builder
+
+
+def test_build_values(mock_build_context):
+    # GIVEN
+    layers_path, platform_path, plan, buildpack_path, stack_id = mock_build_context
+    builder = _make_builder(_ExpectedContext(layers_path, platform_path, buildpack_path, stack_id))
     # WHEN
     libcnb.build(builder)
     # THEN
     assert (layers_path / "test").exists()
     assert not (layers_path / "test-another.toml").exists()
-    assert toml.loads((layers_path / "test.toml").read_text()) == {
+    assert load_toml(layers_path / "test.toml") == {
         "types": {"build": True, "cache": False, "launch": True},
         "metadata": {"test": "1"},
     }
-    assert toml.loads((layers_path / "launch.toml").read_text()) == {
+    assert load_toml(layers_path / "launch.toml") == {
         "labels": [{"key": "test_label", "value": "test"}],
         "processes": [
             {"type": "test", "command": "test", "args": [], "direct": False, "default": False}
@@ -74,78 +83,114 @@ def test_build_values(mock_build_context):
         "slices": [{"paths": [".", "*"]}],
         "bom": [{"name": "test", "metadata": {"test": 1}}],
     }
-    assert toml.loads((layers_path / "build.toml").read_text()) == {
+    assert load_toml(layers_path / "build.toml") == {
         "bom": [{"name": "test", "metadata": {"test": 1}}],
         "unmet": [{"name": "unmet"}],
     }
-    assert toml.loads((layers_path / "store.toml").read_text()) == {"metadata": {"test_store": 1}}
+    assert load_toml(layers_path / "store.toml") == {"metadata": {"test_store": 1}}
 
 
-def test_detect_errors_on_missing_stack(mock_build_context, monkeypatch):
+def test_build_errors_on_wrong_arguments(mock_build_context, monkeypatch):
     # GIVEN
     builder = None
     # WHEN
-    monkeypatch.delenv("CNB_STACK_ID")
+    monkeypatch.setattr("sys.argv", ["build", "layers"])
     # THEN
-    with pytest.raises(Exception, match="CNB_STACK_ID is not set"):
+    with pytest.raises(Exception, match="Usage: build <layers> <platform> <plan>"):
         libcnb.build(builder)
 
 
-def test_build_errors_on_missing_buildpack_path(mock_build_context, monkeypatch):
+@pytest.mark.parametrize(
+    "env_var, value, match",
+    [
+        ("CNB_STACK_ID", None, "CNB_STACK_ID is not set"),
+        ("CNB_BUILDPACK_DIR", None, "CNB_BUILDPACK_DIR is not set"),
+        (
+            "CNB_BUILDPACK_DIR",
+            str(TESTDATA / "old_buildpack"),
+            "This version of libcnb is only compatible with buildpack API .* or greater",
+        ),
+    ],
+)
+def test_build_env_errors(mock_build_context, monkeypatch, env_var, value, match):
     # GIVEN
     builder = None
     # WHEN
-    monkeypatch.delenv("CNB_BUILDPACK_DIR")
+    if value is None:
+        monkeypatch.delenv(env_var)
+    else:
+        monkeypatch.setenv(env_var, value)
     # THEN
-    with pytest.raises(Exception, match="CNB_BUILDPACK_DIR is not set"):
+    with pytest.raises(Exception, match=match):
         libcnb.build(builder)
 
 
-def test_build_errors_on_old_api(mock_build_context, monkeypatch, mock_old_buildpack_path):
+def test_build_context(base_build_context_input, mock_buildpack_path, mock_platform_path):
     # GIVEN
-    builder = None
+    context_input = base_build_context_input
     # WHEN
-    monkeypatch.setenv("CNB_BUILDPACK_DIR", str(mock_old_buildpack_path))
-    print(sys.argv)
+    context: libcnb.BuildContext = libcnb.BuildContext.parse_obj(context_input)
     # THEN
-    with pytest.raises(
-        Exception,
-        match="This version of libcnb is only compatible with buildpack API .* or greater",
-    ):
-        libcnb.build(builder)
+    assert context.application_dir == Path(".").absolute()
+    assert context.buildpack.path == mock_buildpack_path.absolute()
+    assert context.platform.path == mock_platform_path.absolute()
+    assert context.stack_id == "test"
 
 
-def test_build_context(mock_buildpack_path, mock_platform_path, tmp_path):
+def test_build_context_from_paths(
+    base_build_context_input,
+    mock_buildpack,
+    mock_buildpack_path,
+    mock_platform_path,
+    mock_plan,
+    tmp_path,
+):
     # GIVEN
     context_input = {
-        "application_dir": Path(".").absolute(),
-        "layers": libcnb.Layers(path=(tmp_path / "layers")),
-        "store": libcnb.Store(),
-        "plan": libcnb.BuildpackPlan(),
-        "buildpack": libcnb.Buildpack.from_path(mock_buildpack_path),
-        "platform": libcnb.Platform.from_path(mock_platform_path),
-        "stack_id": "test",
+        **base_build_context_input,
+        "store": tmp_path / "store.toml",
+        "plan": str(mock_plan),
+        "buildpack": str(mock_buildpack_path),
+        "platform": mock_platform_path,
     }
     # WHEN
     context: libcnb.BuildContext = libcnb.BuildContext.parse_obj(context_input)
     # THEN
-    assert context.application_dir == Path(".").absolute()
-    assert context.buildpack.path == mock_buildpack_path.absolute()
+    assert context.buildpack == mock_buildpack
     assert context.platform.path == mock_platform_path.absolute()
-    assert context.stack_id == "test"
+    assert context.plan == libcnb.BuildpackPlan.from_path(mock_plan)
+    assert context.store == libcnb.Store()
 
 
-def test_build_context_error(mock_buildpack_path, mock_platform_path, tmp_path):
+def test_build_context_error(base_build_context_input):
     # GIVEN
-    context_input = {
-        "application_dir": Path("."),
-        "layers": libcnb.Layers(path=(tmp_path / "layers")),
-        "store": libcnb.Store(),
-        "plan": libcnb.BuildpackPlan(),
-        "buildpack": 1,
-        "platform": libcnb.Platform.from_path(mock_platform_path),
-        "stack_id": "test",
-    }
+    context_input = {**base_build_context_input, "buildpack": 1}
     # THEN
     with pytest.raises(ValueError, match="Invalid type"):
         libcnb.BuildContext.parse_obj(context_input)
+
+
+def test_build_result_removes_stale_tomls(tmp_path):
+    # GIVEN
+    for name in ("launch", "build", "store", "stale"):
+        (tmp_path / f"{name}.toml").write_text("[metadata]\nold = 1\n")
+    result = libcnb.BuildResult(
+        build_metadata=libcnb.BuildMetadata(unmet=[libcnb.UnmetPlanEntry(name="unmet")])
+    )
+    # WHEN
+    result.to_path(tmp_path)
+    # THEN
+    assert sorted(path.name for path in tmp_path.glob("*.toml")) == ["build.toml", "store.toml"]
+    assert load_toml(tmp_path / "build.toml") == {
+        "bom": [],
+        "unmet": [{"name": "unmet"}],
+    }
+
+
+def test_build_result_without_layers_dir(tmp_path):
+    # GIVEN
+    path = tmp_path / "layers"
+    # WHEN
+    libcnb.BuildResult().to_path(path)
+    # THEN
+    assert not path.exists()
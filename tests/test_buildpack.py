@@ -1,13 +1,14 @@
-from pathlib import Path
-
 import pytest
 
 import libcnb
+from libcnb._buildpack import _api_too_old
+from tests.conftest import TESTDATA
 
 
-def test_buildpack_serialization(mock_buildpack_path):
+@pytest.mark.parametrize("validate", [False, True])
+def test_buildpack_serialization(mock_buildpack_path, validate):
     # WHEN
-    buildpack = libcnb.Buildpack.from_path(mock_buildpack_path)
+    buildpack = libcnb.Buildpack.from_path(mock_buildpack_path, validate=validate)
     # THEN
     assert buildpack == {
         "api": "0.6",
@@ -24,8 +25,52 @@ def test_buildpack_serialization(mock_buildpack_path):
                 {"type_": "Apache-1.1", "uri": "https://spdx.org/licenses/Apache-1.1.html"},
             ],
         },
-        "path": Path("tests/testdata/buildpack").absolute(),
+        "path": TESTDATA / "buildpack",
         "stacks": [{"id": "test-id", "mixins": ["test-name"]}],
         "metadata": {"test-key": "test-value"},
         "order": [{"group": [{"id": "test-id", "version": "2.2.2", "optional": True}]}],
     }
+
+
+@pytest.mark.parametrize("validate", [False, True])
+@pytest.mark.parametrize(
+    "content, missing",
+    [
+        ('api = "0.6"\n[buildpack]\nid = "test-id"\n', "buildpack -> version\n"),
+        ('api = "0.6"\n[buildpack]\nversion = "1.1.1"\n', "buildpack -> id\n"),
+        ('[buildpack]\nid = "test-id"\nversion = "1.1.1"\n', "\napi\n"),
+        ('api = "0.6"\n', "\nbuildpack\n"),
+    ],
+)
+def test_buildpack_validation(tmp_path, content, missing, validate):
+    # GIVEN
+    (tmp_path / "buildpack.toml").write_text(content)
+    # THEN
+    with pytest.raises(ValueError, match=missing):
+        libcnb.Buildpack.from_path(tmp_path, validate=validate)
+
+
+def test_buildpack_is_cached(mock_buildpack_path):
+    # THEN
+    assert libcnb.Buildpack.from_path(mock_buildpack_path) is libcnb.Buildpack.from_path(
+        mock_buildpack_path.absolute()
+    )
+
+
+@pytest.mark.parametrize(
+    "api, too_old",
+    [("0.2", True), ("0.5", True), ("0.6", False), ("0.10", False), ("1.0", False)],
+)
+def test_api_too_old(api, too_old):
+    # THEN
+    assert _api_too_old(api) is too_old
+
+
+@pytest.mark.parametrize("api", ["0.6-rc1", "latest", ""])
+def test_api_not_numeric(api):
+    # THEN
+    with pytest.raises(
+        Exception, match="only compatible with buildpack API .* or greater"
+    ) as error:
+        _api_too_old(api)
+    assert repr(api) in str(error.value)
@@ -1,10 +1,10 @@
-import sys
 from pathlib import Path
+from typing import NamedTuple
 
 import pytest
-import toml
 
 import libcnb
+from tests.conftest import TESTDATA, load_toml
 
 
 def detect_pass(context):
@@ -22,8 +22,6 @@ def mock_detect_context(
     monkeypatch.setattr(
         "sys.argv", ["detect", str(mock_platform_path), str(mock_buildpack_plan_path)]
     )
-    monkeypatch.setenv("CNB_BUILDPACK_DIR", str(mock_buildpack_path))
-    monkeypatch.setenv("CNB_STACK_ID", "test")
     yield mock_platform_path, mock_buildpack_plan_path, mock_buildpack_path, "test"
 
 
@@ -43,15 +41,18 @@ def test_detect_exit(detector, passed, mock_detect_context):
         libcnb.detect(detector)
 
 
-def test_detect_values(mock_detect_context):
-    # GIVEN
-    platform_path, plan, buildpack_path, stack_id = mock_detect_context
-    # WHEN
+class _ExpectedContext(NamedTuple):
+    platform_path: Path
+    buildpack_path: Path
+    stack_id: str
+
+
+def _make_detector(expected: _ExpectedContext):
     def detector(context: libcnb.DetectContext):
         assert context.application_dir == Path(".").absolute()
-        assert context.platform.path == platform_path.absolute()
-        assert context.buildpack.path == buildpack_path.absolute()
-        assert context.stack_id == stack_id
+        assert context.platform.path == expected.platform_path.absolute()
+        assert context.buildpack.path == expected.buildpack_path.absolute()
+        assert context.stack_id == expected.stack_id
         return libcnb.DetectResult(
             passed=True,
             plans=[
@@ -67,9 +68,17 @@ def test_detect_values(mock_detect_context):
             ],
         )
 
+    return detector
+
+
+def test_detect_values(mock_detect_context):
+    # GIVEN
+    platform_path, plan, buildpack_path, stack_id = mock_detect_context
+    detector = _make_detector(_ExpectedContext(platform_path, buildpack_path, stack_id))
+    # WHEN
     libcnb.detect(detector)
     # THEN
-    assert toml.loads(plan.read_text()) == {
+    assert load_toml(plan) == {
         "requires": [],
         "provides": [{"name": "test"}],
         "or": [
@@ -81,58 +90,74 @@ def test_detect_values(mock_detect_context):
     }
 
 
-def test_detect_errors_on_missing_stack(mock_detect_context, monkeypatch):
+def test_detect_errors_on_wrong_arguments(mock_detect_context, monkeypatch):
     # GIVEN
     detector = detect_pass
     # WHEN
-    monkeypatch.delenv("CNB_STACK_ID")
+    monkeypatch.setattr("sys.argv", ["detect"])
     # THEN
-    with pytest.raises(Exception, match="CNB_STACK_ID is not set"):
+    with pytest.raises(Exception, match="Usage: detect <platform> <plan>"):
         libcnb.detect(detector)
 
 
-def test_detect_errors_on_missing_buildpack_path(mock_detect_context, monkeypatch):
+@pytest.mark.parametrize(
+    "env_var, value, match",
+    [
+        ("CNB_STACK_ID", None, "CNB_STACK_ID is not set"),
+        ("CNB_BUILDPACK_DIR", None, "CNB_BUILDPACK_DIR is not set"),
+        (
+            "CNB_BUILDPACK_DIR",
+            str(TESTDATA / "old_buildpack"),
+            "This version of libcnb is only compatible with buildpack API .* or greater",
+        ),
+    ],
+)
+def test_detect_env_errors(mock_detect_context, monkeypatch, env_var, value, match):
     # GIVEN
     detector = detect_pass
     # WHEN
-    monkeypatch.delenv("CNB_BUILDPACK_DIR")
+    if value is None:
+        monkeypatch.delenv(env_var)
+    else:
+        monkeypatch.setenv(env_var, value)
     # THEN
-    with pytest.raises(Exception, match="CNB_BUILDPACK_DIR is not set"):
+    with pytest.raises(Exception, match=match):
         libcnb.detect(detector)
 
 
-def test_detect_errors_on_old_api(mock_detect_context, monkeypatch, mock_old_buildpack_path):
+def test_detect_context(mock_buildpack, mock_platform, mock_buildpack_path, mock_platform_path):
     # GIVEN
-    detector = detect_pass
+    context_input = {
+        "application_dir": Path(".").absolute(),
+        "buildpack": mock_buildpack,
+        "platform": mock_platform,
+        "stack_id": "test",
+    }
     # WHEN
-    monkeypatch.setenv("CNB_BUILDPACK_DIR", str(mock_old_buildpack_path))
-    print(sys.argv)
+    context: libcnb.DetectContext = libcnb.DetectContext.parse_obj(context_input)
     # THEN
-    with pytest.raises(
-        Exception,
-        match="This version of libcnb is only compatible with buildpack API .* or greater",
-    ):
-        libcnb.detect(detector)
+    assert context.application_dir == Path(".").absolute()
+    assert context.buildpack.path == mock_buildpack_path.absolute()
+    assert context.platform.path == mock_platform_path.absolute()
+    assert context.stack_id == "test"
 
 
-def test_detect_context(mock_buildpack_path, mock_platform_path):
+def test_detect_context_from_paths(mock_buildpack_path, mock_platform_path):
     # GIVEN
     context_input = {
         "application_dir": Path(".").absolute(),
-        "buildpack": libcnb.Buildpack.from_path(mock_buildpack_path),
-        "platform": libcnb.Platform.from_path(mock_platform_path),
+        "buildpack": str(mock_buildpack_path),
+        "platform": mock_platform_path,
         "stack_id": "test",
     }
     # WHEN
     context: libcnb.DetectContext = libcnb.DetectContext.parse_obj(context_input)
     # THEN
-    assert context.application_dir == Path(".").absolute()
     assert context.buildpack.path == mock_buildpack_path.absolute()
     assert context.platform.path == mock_platform_path.absolute()
-    assert context.stack_id == "test"
 
 
-def test_detect_context_error(mock_buildpack_path, mock_platform_path):
+def test_detect_context_error():
     # GIVEN
     context_input = {
         "application_dir": Path(".").absolute(),
@@ -0,0 +1,16 @@
+import pytest
+
+import libcnb
+
+
+def test_lazy_exports():
+    # THEN
+    for name in libcnb.__all__:
+        assert getattr(libcnb, name) is not None
+    assert set(libcnb.__all__) <= set(dir(libcnb))
+
+
+def test_unknown_attribute():
+    # THEN
+    with pytest.raises(AttributeError, match="has no attribute 'DNE'"):
+        libcnb.DNE
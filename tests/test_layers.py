@@ -6,9 +6,11 @@ import libcnb
 from tests.conftest import mock_layers
 
 
-def test_get(mock_layers):
+def test_get(shared_layer):
+    # GIVEN
+    _, _, layers = shared_layer
     # WHEN
-    layer: libcnb.Layer = mock_layers.get("DNE")
+    layer: libcnb.Layer = layers.get("DNE")
     # THEN
     assert layer.name == "DNE"
     assert layer.metadata_file.stem == "DNE"
@@ -19,15 +21,118 @@ def test_get(mock_layers):
     assert layer.exec_d.process_file_path("test", "test") == layer.exec_d.path / "test" / "test"
 
 
-def test_load(mock_layer):
+def test_layers_path_is_absolute(monkeypatch, tmp_path):
     # GIVEN
-    layer, layer_name, mock_layers = mock_layer
+    monkeypatch.chdir(tmp_path)
+    # WHEN
+    layers = libcnb.Layers(path="layers")
+    # THEN
+    assert layers.path == tmp_path / "layers"
+    assert layers.get("test").path == tmp_path / "layers" / "test"
+
+
+def test_layer_paths_follow_path_changes(mock_layers):
+    # GIVEN
+    layer: libcnb.Layer = mock_layers.get("first")
+    # WHEN
+    layer.path = layer.path.parent / "second"
+    # THEN
+    assert layer.metadata_file.stem == "second"
+    assert layer.exec_d.path == layer.path / "exec.d"
+
+
+def test_layer_defaults_are_not_shared(tmp_path):
+    # GIVEN
+    first = libcnb.Layer(path=tmp_path / "first")
+    second = libcnb.Layer(path=tmp_path / "second")
+    # WHEN
+    first.shared_env.default("KEY", "value")
+    first.profile.add("script", "value")
+    first.metadata["key"] = "value"
+    # THEN
+    assert second.shared_env == {}
+    assert second.profile == {}
+    assert second.metadata == {}
+
+
+def test_relative_layer_paths_follow_cwd(monkeypatch, tmp_path):
+    # GIVEN
+    layer = libcnb.Layer(path="layer")
+    monkeypatch.chdir(tmp_path)
+    assert layer.metadata_file == tmp_path / "layer.toml"
+    # WHEN
+    (tmp_path / "other").mkdir()
+    monkeypatch.chdir(tmp_path / "other")
+    # THEN
+    assert layer.metadata_file == tmp_path / "other" / "layer.toml"
+
+
+def test_load(shared_layer):
+    # GIVEN
+    layer, layer_name, mock_layers = shared_layer
     # WHEN
     loaded_layer: libcnb.Layer = mock_layers.get(layer_name, load_all=True)
     # THEN
     assert loaded_layer == layer
 
 
+def test_load_many_processes(mock_layers):
+    # GIVEN
+    layer: libcnb.Layer = mock_layers.get("test")
+    layer.shared_env.default("VAR", "test")
+    for index in range(5):
+        layer.process_launch_envs[f"process{index}"] = libcnb.Environment(
+            {"TEST.default": str(index)}
+        )
+        layer.process_profiles[f"process{index}"] = libcnb.Profile({"test": str(index)})
+    layer.dump()
+    # WHEN
+    loaded_layer: libcnb.Layer = mock_layers.get("test", load_all=True)
+    # THEN
+    assert loaded_layer == layer
+
+
+def test_environment_ignores_unknown_suffixes(tmp_path):
+    # GIVEN
+    for name in [
+        "VAR.append",
+        "VAR.delim",
+        "VAR.prepend",
+        "VAR.default",
+        "VAR.override",
+        "VAR",
+        "VARappend",
+    ]:
+        (tmp_path / name).write_text("value")
+    # WHEN
+    env = libcnb.Environment.from_path(tmp_path)
+    # THEN
+    assert set(env) == {"VAR.append", "VAR.delim", "VAR.prepend", "VAR.default", "VAR.override"}
+
+
+def test_dump_omits_none_metadata(mock_layers):
+    # GIVEN
+    layer: libcnb.Layer = mock_layers.get("test")
+    layer.metadata = {"version": None, "name": "test"}
+    # WHEN
+    layer.dump()
+    # THEN
+    assert mock_layers.get("test").metadata == {"name": "test"}
+
+
+def test_load_non_ascii_values(mock_layers):
+    # GIVEN
+    layer: libcnb.Layer = mock_layers.get("test")
+    layer.shared_env.default("GREETING", "grüß dich ✓")
+    layer.profile.add("greeting.sh", "echo 'héllo'")
+    layer.dump()
+    # WHEN
+    loaded_layer: libcnb.Layer = mock_layers.get("test", load_all=True)
+    # THEN
+    assert loaded_layer.shared_env == {"GREETING.default": "grüß dich ✓"}
+    assert loaded_layer.profile == {"greeting.sh": "echo 'héllo'"}
+
+
 def test_reset(mock_layer):
     # GIVEN
     layer, layer_name, mock_layers = mock_layer
@@ -41,22 +146,20 @@ def test_reset(mock_layer):
     assert layer == libcnb.Layer(path=mock_layers.path / layer_name)
 
 
-@pytest.mark.parametrize(
-    "expected_metadata, exact, expected_value",
-    [
+def test_compare_metadata():
+    # GIVEN
+    layer = libcnb.Layer(path="")
+    layer.metadata = {"test": "1", "test2": "2"}
+    cases = [
         ({"test": "1"}, False, True),
         ({"test": "1"}, True, False),
         ({"test": "2"}, False, False),
         ({"test1": "1"}, False, False),
         ({"test": "1", "test2": "2"}, False, True),
         ({"test": "1", "test2": "2"}, True, True),
-    ],
-)
-def test_compare_metadata(expected_metadata, exact, expected_value):
-    # GIVEN
-    layer = libcnb.Layer(path="")
-    layer.metadata = {"test": "1", "test2": "2"}
-    # WHEN
-    output = layer.compare_metadata(expected_metadata, exact=exact)
-    # THEN
-    assert output == expected_value
+    ]
+    for expected_metadata, exact, expected_value in cases:
+        # WHEN
+        output = layer.compare_metadata(expected_metadata, exact=exact)
+        # THEN
+        assert output == expected_value, (expected_metadata, exact)
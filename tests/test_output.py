@@ -1,65 +1,74 @@
-from pathlib import Path
-
 import pytest
-import toml
 
 import libcnb
+from tests.conftest import TESTDATA, load_toml
 
 
-@pytest.fixture
-def mock_store_path():
-    yield Path("tests") / "testdata" / "store.toml"
+@pytest.fixture(scope="session")
+def store_expected(mock_store_path):
+    yield load_toml(mock_store_path)
 
 
-@pytest.fixture
-def mock_launch_path():
-    yield Path("tests") / "testdata" / "launch.toml"
+@pytest.fixture(scope="session")
+def launch_expected(mock_launch_path):
+    yield load_toml(mock_launch_path)
 
 
-@pytest.fixture
-def mock_build_path():
-    yield Path("tests") / "testdata" / "build.toml"
+@pytest.fixture(scope="session")
+def build_expected(mock_build_path):
+    yield load_toml(mock_build_path)
 
 
-def test_store_serialization(mock_store_path, tmp_path):
+def test_store_serialization(mock_store, store_expected, shared_tmp_dir, request):
     # GIVEN
-    store = libcnb.Store.from_path(mock_store_path)
+    output_path = shared_tmp_dir / f"store-{request.node.name}.toml"
     # WHEN
-    store.to_path(tmp_path / "store.toml")
+    mock_store.to_path(output_path)
     # THEN
-    assert toml.loads(mock_store_path.read_text()) == toml.loads(
-        (tmp_path / "store.toml").read_text()
-    )
+    assert store_expected == load_toml(output_path)
 
 
 @pytest.mark.parametrize("cls", [libcnb.Store, libcnb.LaunchMetadata, libcnb.BuildMetadata])
-def test_serialization_empty(cls, tmp_path):
+def test_serialization_empty(cls, shared_tmp_dir, request):
     # GIVEN
     store = cls()
-    output_path = tmp_path / "output.toml"
+    output_path = shared_tmp_dir / f"output-{request.node.name}.toml"
     # WHEN
     store.to_path(output_path)
     # THEN
     assert not output_path.exists()
 
 
-def test_launch_metadata_serialization(mock_launch_path, tmp_path):
+def test_launch_metadata_serialization(mock_launch_path, launch_expected, shared_tmp_dir, request):
     # GIVEN
     launch_metadata = libcnb.LaunchMetadata.from_path(mock_launch_path)
+    output_path = shared_tmp_dir / f"launch-{request.node.name}.toml"
     # WHEN
-    launch_metadata.to_path(tmp_path / "launch.toml")
+    launch_metadata.to_path(output_path)
     # THEN
-    assert toml.loads(mock_launch_path.read_text()) == toml.loads(
-        (tmp_path / "launch.toml").read_text()
-    )
+    assert launch_expected == load_toml(output_path)
 
 
-def test_build_metadata_serialization(mock_build_path, tmp_path):
+def test_build_metadata_serialization(mock_build_path, build_expected, shared_tmp_dir, request):
     # GIVEN
     build_metadata = libcnb.BuildMetadata.from_path(mock_build_path)
+    output_path = shared_tmp_dir / f"build-{request.node.name}.toml"
     # WHEN
-    build_metadata.to_path(tmp_path / "build.toml")
+    build_metadata.to_path(output_path)
+    # THEN
+    assert build_expected == load_toml(output_path)
+
+
+@pytest.mark.parametrize(
+    "cls, path",
+    [
+        (libcnb.Store, TESTDATA / "store.toml"),
+        (libcnb.LaunchMetadata, TESTDATA / "launch.toml"),
+        (libcnb.BuildMetadata, TESTDATA / "build.toml"),
+    ],
+)
+def test_as_dict_matches_dict(cls, path):
+    # GIVEN
+    output = cls.from_path(path)
     # THEN
-    assert toml.loads(mock_build_path.read_text()) == toml.loads(
-        (tmp_path / "build.toml").read_text()
-    )
+    assert output._as_dict() == output.dict(by_alias=True)
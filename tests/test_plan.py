@@ -1,19 +1,11 @@
-from pathlib import Path
-
-import pytest
-
 import libcnb
 
 
-@pytest.fixture
-def mock_plan_path():
-    yield Path("tests") / "testdata" / "plan.toml"
-
-
-def test_plan_serialization(mock_plan_path):
+def test_plan_serialization(mock_plan):
     # WHEN
-    build_plan = libcnb.BuildpackPlan.from_path(mock_plan_path)
+    build_plan = libcnb.BuildpackPlan.from_path(mock_plan)
     # THEN
+    assert all(isinstance(entry, libcnb.BuildpackPlanEntry) for entry in build_plan.entries)
     assert build_plan == {
         "entries": [
             {
@@ -5,11 +5,9 @@ import pytest
 import libcnb
 
 
-def test_platform_serialization(mock_platform_path):
-    # WHEN
-    platform = libcnb.Platform.from_path(mock_platform_path)
+def test_platform_serialization(mock_platform):
     # THEN
-    assert platform.env == {"TEST": "value", "T2": "another value\n\nin\n\nmultiple\n\nlines"}
+    assert mock_platform.env == {"TEST": "value", "T2": "another value\n\nin\n\nmultiple\n\nlines"}
 
 
 def test_empty_platform():
@@ -17,3 +15,21 @@ def test_empty_platform():
     platform = libcnb.Platform(path="")
     # THEN
     assert platform.env == {}
+
+
+def test_platform_without_env(tmp_path):
+    # WHEN
+    platform = libcnb.Platform.from_path(tmp_path)
+    # THEN
+    assert platform.path == tmp_path
+    assert platform.env == {}
+
+
+def test_platform_non_ascii_env(tmp_path):
+    # GIVEN
+    (tmp_path / "env").mkdir()
+    (tmp_path / "env" / "GREETING").write_bytes("grüß dich ✓".encode("utf-8"))
+    # WHEN
+    platform = libcnb.Platform.from_path(tmp_path)
+    # THEN
+    assert platform.env == {"GREETING": "grüß dich ✓"}
@@ -1,16 +1,22 @@
-from unittest.mock import Mock
-
 import pytest
 
 import libcnb
 
 
+class _Stub:
+    def __init__(self):
+        self.called = False
+
+    def __call__(self, *args, **kwargs):
+        self.called = True
+
+
 @pytest.fixture
 def mock_phases(monkeypatch):
-    detect_mock = Mock()
-    build_mock = Mock()
-    monkeypatch.setattr("libcnb._run.detect", detect_mock)
-    monkeypatch.setattr("libcnb._run.build", build_mock)
+    detect_mock = _Stub()
+    build_mock = _Stub()
+    monkeypatch.setattr("libcnb._detect.detect", detect_mock)
+    monkeypatch.setattr("libcnb._build.build", build_mock)
     yield detect_mock, build_mock
 
 
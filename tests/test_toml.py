@@ -0,0 +1,41 @@
+import pytest
+
+from libcnb import _toml
+
+
+def test_dump_roundtrip(tmp_path):
+    # GIVEN
+    path = tmp_path / "test.toml"
+    data = {"types": {"launch": True}, "metadata": {"key": "value"}}
+    # WHEN
+    _toml.dump(data, path)
+    # THEN
+    assert _toml.load(path) == data
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_dump_omits_none_values(tmp_path):
+    # GIVEN
+    path = tmp_path / "test.toml"
+    data = {"key": None, "table": {"key": None, "other": 1}, "array": [{"key": None, "other": 2}]}
+    # WHEN
+    _toml.dump(data, path)
+    # THEN
+    assert _toml.load(path) == {"table": {"other": 1}, "array": [{"other": 2}]}
+
+
+def test_dump_failure_keeps_existing_file(monkeypatch, tmp_path):
+    # GIVEN
+    path = tmp_path / "test.toml"
+    _toml.dump({"key": "old"}, path)
+
+    def _fail(*args):
+        raise OSError("replace failed")
+
+    monkeypatch.setattr("os.replace", _fail)
+    # WHEN
+    with pytest.raises(OSError, match="replace failed"):
+        _toml.dump({"key": "new"}, path)
+    # THEN
+    assert _toml.load(path) == {"key": "old"}
+    assert list(tmp_path.iterdir()) == [path]